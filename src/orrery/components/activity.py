@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Set
+from typing import Any, Dict, FrozenSet, Iterable
 
 from orrery.core.ecs import Component
 
@@ -37,22 +37,45 @@ class ActivityInstance:
         raise TypeError(f"Expected Activity but was {type(object)}")
 
 
+def _activity_mask(activities: Iterable[ActivityInstance]) -> int:
+    """Return a bitmask with the bit at each activity's uid set"""
+    mask = 0
+    for activity in activities:
+        mask |= 1 << activity.uid
+    return mask
+
+
 class Activities(Component):
     """
     A collection of all the activities that characters can engage in at a location
+
+    Attributes
+    ----------
+    _activities: FrozenSet[Activity]
+        The set of activities available at the location
+    _mask: int
+        Bitmask of the activities' uids used for membership checks
     """
 
-    __slots__ = "_activities"
+    __slots__ = "_activities", "_mask"
 
-    def __init__(self, activities: Set[ActivityInstance]) -> None:
+    def __init__(self, activities: Iterable[ActivityInstance]) -> None:
         super().__init__()
-        self._activities: Set[ActivityInstance] = activities
+        self._activities: FrozenSet[ActivityInstance] = frozenset(activities)
+        self._mask: int = _activity_mask(self._activities)
+
+    @property
+    def mask(self) -> int:
+        """Bitmask with the bit at each activity's uid set"""
+        return self._mask
 
     def to_dict(self) -> Dict[str, Any]:
         return {"activities": [a.name for a in self._activities]}
 
     def __contains__(self, activity: ActivityInstance) -> bool:
-        return activity in self._activities
+        if isinstance(activity, ActivityInstance):
+            return self._mask >> activity.uid & 1 == 1
+        return False
 
     def __str__(self) -> str:
         return super().__repr__()
@@ -67,24 +90,39 @@ class LikedActivities(Component):
 
     Attributes
     ----------
-    activities: Set[Activity]
+    _activities: FrozenSet[Activity]
         The set of activities that a character likes
+    _mask: int
+        Bitmask of the activities' uids used for membership checks
     """
 
-    __slots__ = "activities"
+    __slots__ = "_activities", "_mask"
 
-    def __init__(self, activities: Set[ActivityInstance]) -> None:
+    def __init__(self, activities: Iterable[ActivityInstance]) -> None:
         super().__init__()
-        self.activities: Set[ActivityInstance] = activities
+        self._activities: FrozenSet[ActivityInstance] = frozenset(activities)
+        self._mask: int = _activity_mask(self._activities)
+
+    @property
+    def activities(self) -> FrozenSet[ActivityInstance]:
+        """The set of activities that a character likes"""
+        return self._activities
+
+    @property
+    def mask(self) -> int:
+        """Bitmask with the bit at each activity's uid set"""
+        return self._mask
 
     def to_dict(self) -> Dict[str, Any]:
-        return {"activities": [a.name for a in self.activities]}
+        return {"activities": [a.name for a in self._activities]}
 
     def __contains__(self, activity: ActivityInstance) -> bool:
-        return activity in self.activities
+        if isinstance(activity, ActivityInstance):
+            return self._mask >> activity.uid & 1 == 1
+        return False
 
     def __str__(self) -> str:
         return super().__repr__()
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}({self.activities.__repr__()})"
+        return f"{self.__class__.__name__}({self._activities.__repr__()})"
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import Any, Dict, Iterator, List, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Tuple
 
 from orrery.core.ecs import Component
 
@@ -167,20 +168,19 @@ class RelationshipStat:
 
     def _recalculate_values(self) -> None:
         """Recalculate the various values since the last change"""
-        combined_increments = self._base + self._from_modifiers
+        # Sum the counters directly instead of allocating a combined
+        # IncrementCounter every time the stat is recalculated
+        increments = self._base.increments + self._from_modifiers.increments
+        decrements = self._base.decrements + self._from_modifiers.decrements
 
-        self._raw_value = (
-            combined_increments.increments - combined_increments.decrements
-        )
+        self._raw_value = increments - decrements
 
-        total_changes = combined_increments.increments + combined_increments.decrements
+        total_changes = increments + decrements
 
         if total_changes == 0:
             self._normalized_value = 0.5
         else:
-            self._normalized_value = (
-                float(combined_increments.increments) / total_changes
-            )
+            self._normalized_value = float(increments) / total_changes
 
         self._scaled_value = math.ceil(
             lerp(self._min_value, self._max_value, self._normalized_value)
@@ -207,11 +207,19 @@ class RelationshipStat:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RelationshipModifier:
+    """Changes to relationship stats applied by a social rule
+
+    Modifiers are shared between relationships, so they and their values are
+    read-only.
+    """
 
     name: str
-    values: Dict[str, int]
+    values: Mapping[str, int]
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "values", MappingProxyType(dict(self.values)))
 
     def to_dict(self) -> Dict[str, Any]:
         return {"name": self.name, "values": {**self.values}}
@@ -254,6 +262,25 @@ class Relationship(Component):
                 self[stat_name].remove_modifier(value)
         self.modifiers.clear()
 
+    def replace_modifiers(self, modifiers: List[RelationshipModifier]) -> None:
+        """Remove all current modifiers and apply the given ones in their place
+
+        Every stat name is resolved before anything is changed, so an unknown
+        stat leaves the relationship as it was.
+        """
+        changes = [
+            (self[stat_name], value)
+            for modifier in modifiers
+            for stat_name, value in modifier.values.items()
+        ]
+
+        self.clear_modifiers()
+
+        for stat, value in changes:
+            stat.add_modifier(value)
+
+        self.modifiers.extend(modifiers)
+
     def __getitem__(self, item: str) -> RelationshipStat:
         try:
             return self._stats[item]
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import enum
 import logging
+import math
 from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
@@ -49,6 +50,11 @@ class VirtueType(enum.IntEnum):
     TRANQUILITY = enum.auto()
 
 
+# VirtueType members in index order, so vector positions map back to members
+# without rebuilding the list each call
+_VIRTUE_TYPES: Tuple[VirtueType, ...] = tuple(VirtueType)
+
+
 class Virtues(Component):
     """
     Values are what an entity believes in. They are used
@@ -70,15 +76,15 @@ class Virtues(Component):
 
     def __init__(self, overrides: Optional[Dict[str, int]] = None) -> None:
         super().__init__()
-        self._virtues: npt.NDArray[np.int32] = np.zeros(  # type: ignore
-            len(VirtueType), dtype=np.int32
+        self._virtues: npt.NDArray[np.int16] = np.zeros(  # type: ignore
+            len(VirtueType), dtype=np.int16
         )
 
         if overrides:
             for trait, value in overrides.items():
                 self[VirtueType[trait]] = value
 
-    def to_array(self) -> npt.NDArray[np.int32]:
+    def to_array(self) -> npt.NDArray[np.int16]:
         """Converts the virtue"""
         return self._virtues
 
@@ -96,33 +102,31 @@ class Virtues(Component):
         float
             Similarity score on the range [-1.0, 1.0]
         """
-        # Cosine similarity is a value between -1 and 1
-        norm_product: float = float(
-            np.linalg.norm(self.to_array()) * np.linalg.norm(other.to_array())  # type: ignore
+        # Cosine similarity is a value between -1 and 1. The products are taken
+        # in float64 since a dot product of two int16 vectors overflows int16
+        self_values = self._virtues.astype(np.float64)
+        other_values = other._virtues.astype(np.float64)
+
+        norm_product: float = math.sqrt(
+            float(self_values.dot(self_values)) * float(other_values.dot(other_values))
         )
 
         if norm_product == 0:
             return 0
         else:
-            return round(
-                float(np.dot(self.to_array(), other.to_array()) / norm_product), 2  # type: ignore
-            )
+            return round(float(self_values.dot(other_values)) / norm_product, 2)
 
     def get_high_values(self, n: int = 3) -> List[VirtueType]:
         """Return the virtues names associated with the n-highest values"""
         sorted_index_array = np.argsort(self.to_array())[-n:]  # type: ignore
 
-        value_names = list(VirtueType)
-
-        return [value_names[i] for i in sorted_index_array]
+        return [_VIRTUE_TYPES[i] for i in sorted_index_array]
 
     def get_low_values(self, n: int = 3) -> List[VirtueType]:
         """Return the virtues names associated with the n-lowest values"""
         sorted_index_array = np.argsort(self.to_array())[:n]  # type: ignore
 
-        value_names = list(VirtueType)
-
-        return [value_names[i] for i in sorted_index_array]
+        return [_VIRTUE_TYPES[i] for i in sorted_index_array]
 
     def __getitem__(self, item: int) -> int:
         return int(self._virtues[item])
@@ -137,16 +141,10 @@ class Virtues(Component):
         return "{}({})".format(self.__class__.__name__, self._virtues.__repr__())
 
     def __iter__(self) -> Iterator[Tuple[VirtueType, int]]:
-        virtue_dict = {
-            virtue: int(self._virtues[i]) for i, virtue in enumerate(list(VirtueType))
-        }
-
-        return virtue_dict.items().__iter__()
+        return zip(_VIRTUE_TYPES, self._virtues.tolist())
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            **{
-                virtue.name: int(self._virtues[i])
-                for i, virtue in enumerate(list(VirtueType))
-            },
+            virtue.name: value
+            for virtue, value in zip(_VIRTUE_TYPES, self._virtues.tolist())
         }
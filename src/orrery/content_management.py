@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import random
 import re
+import sys
 from typing import Dict, Iterator, List, Optional, Set
 
 from orrery.components.activity import ActivityInstance
@@ -30,6 +31,10 @@ class ActivityLibrary:
         Map of the names of activities to Activity instances
     _id_to_name: Dict[int, str]
         Map of the unique ids of activities to their names
+    _spellings: Dict[str, ActivityInstance]
+        Map of each activity's lower-case name and the spelling it was
+        registered with to its Activity instance, so lookups with those
+        names skip lowercasing
 
     Notes
     -----
@@ -38,16 +43,20 @@ class ActivityLibrary:
     location instances.
     """
 
-    __slots__ = "_next_id", "_name_to_activity", "_id_to_name"
+    __slots__ = "_next_id", "_name_to_activity", "_id_to_name", "_spellings"
 
     def __init__(self) -> None:
         self._next_id: int = 0
         self._name_to_activity: Dict[str, ActivityInstance] = {}
         self._id_to_name: Dict[int, str] = {}
+        self._spellings: Dict[str, ActivityInstance] = {}
 
     def __contains__(self, activity_name: str) -> bool:
         """Return True if a service type exists with the given name"""
-        return activity_name.lower() in self._name_to_activity
+        return (
+            activity_name in self._spellings
+            or activity_name.lower() in self._name_to_activity
+        )
 
     def __iter__(self) -> Iterator[ActivityInstance]:
         """Return iterator for the ActivityLibrary"""
@@ -58,9 +67,16 @@ class ActivityLibrary:
         Get an Activity instance and create a new one if a
         matching instance does not exist
         """
-        lc_activity_name = activity_name.lower()
+        try:
+            return self._spellings[activity_name]
+        except KeyError:
+            pass
+
+        lc_activity_name = sys.intern(activity_name.lower())
 
         if lc_activity_name in self._name_to_activity:
+            # Other spellings are not cached, so callers cannot grow the
+            # table without bound
             return self._name_to_activity[lc_activity_name]
 
         if create_new is False:
@@ -71,6 +87,8 @@ class ActivityLibrary:
         activity = ActivityInstance(uid, lc_activity_name)
         self._name_to_activity[lc_activity_name] = activity
         self._id_to_name[uid] = lc_activity_name
+        self._spellings[lc_activity_name] = activity
+        self._spellings[activity_name] = activity
         return activity
 
 
@@ -124,6 +142,7 @@ class ServiceLibrary:
         if lc_service_name in self._name_to_id:
             return self._services[self._name_to_id[lc_service_name]]
 
+        lc_service_name = sys.intern(lc_service_name)
         uid = self._next_id
         self._next_id += 1
         service_type = ServiceType(uid, lc_service_name)
@@ -154,7 +173,7 @@ class OccupationTypeLibrary:
         """
         if occupation_type.name in self._registry:
             logger.debug(f"Overwriting OccupationType: ({occupation_type.name})")
-        self._registry[occupation_type.name] = occupation_type
+        self._registry[sys.intern(occupation_type.name)] = occupation_type
 
     def get(self, name: str) -> OccupationType:
         """
@@ -194,7 +213,7 @@ class BusinessLibrary:
         prefab: BusinessPrefab
             The prefab to add
         """
-        self._prefabs[prefab.name] = prefab
+        self._prefabs[sys.intern(prefab.name)] = prefab
 
     def get_all(self) -> List[BusinessPrefab]:
         """Get all stored prefabs"""
@@ -261,7 +280,7 @@ class CharacterLibrary:
 
     def add(self, prefab: CharacterPrefab) -> None:
         """Register a new prefab"""
-        self._prefabs[prefab.name] = prefab
+        self._prefabs[sys.intern(prefab.name)] = prefab
 
     def get_all(self) -> List[CharacterPrefab]:
         """Get all stored archetypes"""
@@ -312,7 +331,7 @@ class ResidenceLibrary:
 
     def add(self, prefab: ResidencePrefab) -> None:
         """Register a new prefab"""
-        self._prefabs[prefab.name] = prefab
+        self._prefabs[sys.intern(prefab.name)] = prefab
 
     def get_all(self) -> List[ResidencePrefab]:
         """Get all stored archetypes"""
@@ -41,7 +41,6 @@ from typing import (
 )
 
 import esper
-from ordered_set import OrderedSet
 
 logger = logging.getLogger(__name__)
 
@@ -170,13 +169,22 @@ class GameObject:
         The GameObject that this GameObject is a child of
     """
 
-    __slots__ = "_id", "name", "_world", "children", "parent", "_is_active"
+    __slots__ = (
+        "_id",
+        "_name",
+        "_world",
+        "children",
+        "parent",
+        "_is_active",
+        "_components",
+    )
 
     def __init__(
         self,
         unique_id: int,
         world: World,
         name: str = "",
+        components: Optional[Dict[Type[Component], Component]] = None,
     ) -> None:
         """
         Parameters
@@ -188,19 +196,39 @@ class GameObject:
         name: str, optional
             An optional name to give to the GameObject
             (Defaults to 'GameObject(<unique_id>)')
+        components: Dict[Type[Component], Component], optional
+            Components attached to this GameObject, keyed by type
+            (Defaults to an empty dict)
         """
-        self.name: str = name if name else f"GameObject({unique_id})"
+        self._name: str = name
         self._id: int = unique_id
         self._world: World = world
         self.parent: Optional[GameObject] = None
         self.children: List[GameObject] = []
         self._is_active: bool = True
+        self._components: Dict[Type[Component], Component] = (
+            components if components is not None else {}
+        )
 
     @property
     def uid(self) -> int:
         """Return GameObject's ID"""
         return self._id
 
+    @property
+    def name(self) -> str:
+        """Return the GameObject's name"""
+        # The default name is only formatted when it is read, since most
+        # GameObjects (relationships, businesses, etc.) are never displayed
+        if self._name:
+            return self._name
+        return f"GameObject({self._id})"
+
+    @name.setter
+    def name(self, value: str) -> None:
+        """Set the GameObject's name"""
+        self._name = value
+
     @property
     def world(self) -> World:
         """Return the world that this GameObject belongs to"""
@@ -228,11 +256,7 @@ class GameObject:
 
     def get_components(self) -> Tuple[Component, ...]:
         """Returns the component instances associated with this GameObject"""
-        try:
-            return self.world.get_components_for_entity(self.uid)
-        except KeyError:
-            # Ignore errors if gameobject is not found in esper ecs
-            return ()
+        return tuple(self._components.values())
 
     def get_component_types(self) -> Tuple[Type[Component], ...]:
         """Returns the types of components attached to this character"""
@@ -250,7 +274,7 @@ class GameObject:
         -----
         Adding components is an immediate operation.
         """
-        self.world.add_component(self.uid, component)
+        self._world.add_component(self._id, component)
 
     def remove_component(self, component_type: Type[Component]) -> None:
         """Remove a component from the GameObject
@@ -260,23 +284,29 @@ class GameObject:
         component_type: Type[Component]
             The type of the component to remove
         """
-        self.world.remove_component(self.uid, component_type)
+        self._world.remove_component(self._id, component_type)
+
+    # The component accessors below read the GameObject's own component table,
+    # which the World keeps in sync with esper, instead of going through the
+    # World and esper. They are called for nearly
+    # every status, trait, and relationship check in the simulation.
 
     def get_component(self, component_type: Type[_CT]) -> _CT:
-        return self.world.get_component_for_entity(self.uid, component_type)
+        try:
+            return self._components[component_type]  # type: ignore
+        except KeyError:
+            raise ComponentNotFoundError(component_type)
 
     def has_components(self, *component_types: Type[Component]) -> bool:
-        return self.world.has_components(self.uid, *component_types)
+        components = self._components
+        return all([component_type in components for component_type in component_types])
 
     def has_component(self, component_type: Type[Component]) -> bool:
         """Check if this entity has a component of a given type"""
-        return self.world.has_component(self.uid, component_type)
+        return component_type in self._components
 
     def try_component(self, component_type: Type[_CT]) -> Optional[_CT]:
-        try:
-            return self.world.try_component_for_entity(self.uid, component_type)
-        except KeyError:
-            return None
+        return self._components.get(component_type)  # type: ignore
 
     def add_child(self, gameobject: GameObject) -> None:
         """Add a GameObject as the child of this GameObject"""
@@ -671,11 +701,27 @@ class World:
         Esper ECS instance used for efficiency
     _gameobjects: Dict[int, GameObject]
         Mapping of GameObjects to unique identifiers
-    _dead_gameobjects: List[int]
-        List of identifiers for GameObject to remove after
-        the latest time step
+    _dead_gameobjects: Dict[int, None]
+        Identifiers for GameObject to remove after the latest time step
     _resources: Dict[Type, Any]
         Global resources shared by systems in the ECS
+    _removed_components: DefaultDict[Type, Dict[RemovedComponentPair, None]]
+        Components removed during the latest time step, by component type
+    _added_components: DefaultDict[Type, Dict[int, None]]
+        Identifiers of GameObjects given a component during the latest time step
+    _structure_revision: int
+        Counter incremented whenever a component is added to or removed from
+        any GameObject, used to invalidate cached query results
+    _gameobject_id_cache: Dict[Tuple[Type, ...], Tuple[int, List[Tuple[int]]]]
+        IDs of GameObjects with a given combination of components, and the
+        structure revision the IDs were collected at
+
+    Notes
+    -----
+    The change-tracking collections above are dicts used as insertion-ordered
+    sets. CPython dicts already store their entries in a dense array indexed by
+    a sparse hash table, so inserts and membership checks stay in C instead of
+    going through OrderedSet's Python methods on every component change.
     """
 
     __slots__ = (
@@ -688,26 +734,37 @@ class World:
         "_removed_components",
         "_added_components",
         "_systems",
+        "_structure_revision",
+        "_gameobject_id_cache",
     )
 
     def __init__(self) -> None:
         self._ecs: esper.World = esper.World()
         self._gameobjects: Dict[int, GameObject] = {}
-        self._dead_gameobjects: OrderedSet[int] = OrderedSet([])
+        self._dead_gameobjects: Dict[int, None] = {}
         self._resources: Dict[Type[Any], Any] = {}
         self._component_types: Dict[str, ComponentInfo] = {}
         self._component_factories: Dict[Type[Component], IComponentFactory] = {}
         self._removed_components: DefaultDict[
-            Type[Component], OrderedSet[RemovedComponentPair]
-        ] = defaultdict(lambda: OrderedSet())
+            Type[Component], Dict[RemovedComponentPair, None]
+        ] = defaultdict(dict)
         self._added_components: DefaultDict[
-            Type[Component], OrderedSet[int]
-        ] = defaultdict(lambda: OrderedSet())
+            Type[Component], Dict[int, None]
+        ] = defaultdict(dict)
         self._systems: SystemGroup = RootSystemGroup()
+        self._structure_revision: int = 0
+        self._gameobject_id_cache: Dict[
+            Tuple[Type[Component], ...], Tuple[int, List[Tuple[int]]]
+        ] = {}
         # The RootSystemGroup should be the only system that is directly added
         # to esper
         self._ecs.add_processor(self._systems)
 
+    @property
+    def structure_revision(self) -> int:
+        """Return a counter that increases whenever GameObjects' components change"""
+        return self._structure_revision
+
     def spawn_gameobject(
         self, components: Optional[List[Component]] = None, name: Optional[str] = None
     ) -> GameObject:
@@ -716,10 +773,14 @@ class World:
 
         entity_id = self._ecs.create_entity(*components_to_add)
 
+        if components_to_add:
+            self._structure_revision += 1
+
         gameobject = GameObject(
             unique_id=entity_id,
             world=self,
-            name=(name if name else f"GameObject({entity_id})"),
+            name=(name if name else ""),
+            components={type(c): c for c in components_to_add},
         )
 
         self._gameobjects[gameobject.uid] = gameobject
@@ -752,7 +813,7 @@ class World:
 
         gameobject.set_active(False)
 
-        self._dead_gameobjects.append(gid)
+        self._dead_gameobjects[gid] = None
 
         # Recursively remove all children
         for child in gameobject.children:
@@ -760,31 +821,34 @@ class World:
 
     def add_component(self, gid: int, component: Component) -> None:
         """Add a component to an entity"""
-        component.set_gameobject(self._gameobjects[gid])
+        gameobject = self._gameobjects[gid]
+        component.set_gameobject(gameobject)
+        self._structure_revision += 1
         component_type = type(component)
-        self._added_components[component_type].append(int(gid))
+        self._added_components[component_type][int(gid)] = None
         self._ecs.add_component(int(gid), component)
+        gameobject._components[component_type] = component
 
     def remove_component(self, gid: int, component_type: Type[Component]) -> None:
         """Remove a component from an entity"""
 
         try:
-            if not self.has_component(gid, component_type):
-                return
-
-            component = self.get_component_for_entity(gid, component_type)
-
-            self._removed_components[component_type].append(
-                RemovedComponentPair(gid, component)
-            )
-
-            self._ecs.remove_component(int(gid), component_type)
-
+            # Fetching the component doubles as the existence check
+            component = self._ecs.component_for_entity(gid, component_type)
         except KeyError:
             # This will throw a key error if the GameObject does not
-            # have any components.
+            # have any components or the given component.
             return
 
+        self._ecs.remove_component(int(gid), component_type)
+        del self._gameobjects[gid]._components[component_type]
+
+        self._removed_components[component_type][
+            RemovedComponentPair(gid, component)
+        ] = None
+
+        self._structure_revision += 1
+
     def get_component(self, component_type: Type[_CT]) -> List[Tuple[int, _CT]]:
         """Get all the gameobjects that have a given component type"""
         return self._ecs.get_component(component_type)
@@ -945,6 +1009,24 @@ class World:
         # world.get_components()
         return ret  # type: ignore
 
+    def get_gameobject_ids(
+        self, component_types: Tuple[Type[Component], ...]
+    ) -> List[Tuple[int]]:
+        """Get the IDs of all game objects with the given components
+
+        IDs are returned as single-element tuples so they can be used directly as
+        query rows. Results are cached until a component is added to or removed
+        from any GameObject, so the returned list must not be modified.
+        """
+        cached = self._gameobject_id_cache.get(component_types)
+
+        if cached is not None and cached[0] == self._structure_revision:
+            return cached[1]
+
+        results = [(guid,) for guid, _ in self._ecs.get_components(*component_types)]
+        self._gameobject_id_cache[component_types] = (self._structure_revision, results)
+        return results
+
     def has_components(self, guid: int, *component_types: Type[_CT]) -> bool:
         try:
             return self._ecs.has_components(guid, *component_types)
@@ -975,11 +1057,13 @@ class World:
     def _clear_dead_gameobjects(self) -> None:
         """Delete gameobjects that were removed from the world"""
         for gameobject_id in self._dead_gameobjects:
-            if len(self._gameobjects[gameobject_id].get_components()) > 0:
-                self._ecs.delete_entity(gameobject_id, True)
-
             gameobject = self._gameobjects[gameobject_id]
 
+            if gameobject._components:
+                self._ecs.delete_entity(gameobject_id, True)
+                gameobject._components.clear()
+                self._structure_revision += 1
+
             if gameobject.parent is not None:
                 gameobject.parent.remove_child(gameobject)
 
@@ -123,6 +123,21 @@ class Relation:
     def get_bindings(self) -> List[Tuple[int, ...]]:
         return self._bindings
 
+    def get_symbol_indices(self, *symbols: str) -> Tuple[int, ...]:
+        """Return the positions of the given symbols within each binding
+
+        Throws
+        ------
+        SymbolsNotInRelation
+            If any of the symbols are not in this relation
+        """
+        try:
+            return tuple([self._symbol_map[s] for s in symbols])
+        except KeyError:
+            raise SymbolsNotInRelation(
+                *[s for s in symbols if s not in self._symbol_map]
+            )
+
     @overload
     def get_as_dict(self, idx: int, *symbols: str) -> Dict[str, int]:
         ...
@@ -160,20 +175,15 @@ class Relation:
     ) -> Union[Tuple[int, ...], List[Tuple[int, ...]]]:
         return_symbols = symbols if symbols else self._symbols
 
-        symbols_not_in_relation = [s for s in return_symbols if s not in self._symbols]
-        if symbols_not_in_relation:
-            raise SymbolsNotInRelation(*symbols_not_in_relation)
+        # Resolve the symbol positions once instead of zipping every binding
+        # into a dict
+        indices = self.get_symbol_indices(*return_symbols)
 
         if isinstance(idx, int):
-            binding = dict(zip(self._symbols, self._bindings[idx]))
+            binding = self._bindings[idx]
+            return tuple([binding[i] for i in indices])
 
-            return tuple([binding[k] for k in return_symbols])
-
-        results: List[Tuple[int, ...]] = []
-        for entry in self._bindings[idx]:
-            binding = dict(zip(self._symbols, entry))
-            results.append(tuple([binding[k] for k in return_symbols]))
-        return results
+        return [tuple([entry[i] for i in indices]) for entry in self._bindings[idx]]
 
     def get_tuples(self, *symbols: str) -> List[Tuple[int, ...]]:
         """Return tuples containing the values from this relation"""
@@ -207,30 +217,29 @@ class Relation:
 
     def hash_join(self, other: Relation, *symbols: str) -> Relation:
         """Perform a join between the relations using the given symbols for equivalency"""
-        h: DefaultDict[Tuple[int, ...], List[int]] = defaultdict(list)
-
-        for i, s in enumerate(other.get_tuples(*symbols)):
-            h[s].append(i)
+        own_symbols = set(self._symbols)
+        symbols_to_concat = tuple([s for s in other._symbols if s not in own_symbols])
+
+        other_key_indices = other.get_symbol_indices(*symbols)
+        concat_indices = other.get_symbol_indices(*symbols_to_concat)
+        self_key_indices = self.get_symbol_indices(*symbols)
+
+        # Map each join key to the values that the other relation contributes
+        # to the joined rows, so matches are concatenated without any more
+        # symbol lookups
+        h: DefaultDict[Tuple[int, ...], List[Tuple[int, ...]]] = defaultdict(list)
+        for row in other._bindings:
+            h[tuple([row[i] for i in other_key_indices])].append(
+                tuple([row[i] for i in concat_indices])
+            )
 
         results: List[Tuple[int, ...]] = []
-
-        symbols_to_concat = tuple(
-            set(other.get_symbols()).difference(set(self.get_symbols()))
-        )
-
-        for i, s in enumerate(self.get_tuples(*symbols)):
-            binding = self.get_bindings()[i]
-            matches = h.get(s)
+        for row in self._bindings:
+            matches = h.get(tuple([row[i] for i in self_key_indices]))
             if matches is not None:  # join
-                for match in matches:
-                    if symbols_to_concat:
-                        results.append(
-                            binding + other.get_as_tuple(match, *symbols_to_concat)
-                        )
-                    else:
-                        results.append(binding)
+                results.extend([row + extra for extra in matches])
 
-        new_symbols = self.get_symbols() + symbols_to_concat
+        new_symbols = self._symbols + symbols_to_concat
 
         return Relation(new_symbols, results)
 
@@ -416,9 +425,9 @@ class QueryBuilder:
         """Adds results to the current query for game objects with all the given components"""
 
         def clause(ctx: QueryContext, world: World) -> Relation:
-            results = list(
-                map(lambda result: (result[0],), world.get_components(component_types))
-            )
+            # Relations never modify their bindings in place, so the World's
+            # cached list of IDs can be shared between executions
+            results = world.get_gameobject_ids(component_types)
 
             chosen_variable = (
                 variable if variable is not None else ctx.output_symbols[0]
@@ -510,18 +519,27 @@ class QueryBuilder:
             if len(relation_symbols) == 1 and len(variables_to_check) == 0:
                 variables_to_check = relation_symbols
 
+            # Resolve where the variables are in each row once, rather than
+            # looking them up by name for every row
+            indices = ctx.relation.get_symbol_indices(*variables_to_check)
+            get_gameobject = world.get_gameobject
+
             # Only keep rows that pass the filter
-            valid_bindings = [
-                row
-                for i, row in enumerate(ctx.relation.get_bindings())
-                if filter_fn(
-                    world,
-                    *[
-                        world.get_gameobject(gid)
-                        for gid in ctx.relation.get_as_tuple(i, *variables_to_check)
-                    ],
-                )
-            ]
+            if len(indices) == 1:
+                # Most filters check a single variable, so skip building an
+                # argument list for every row
+                (index,) = indices
+                valid_bindings = [
+                    row
+                    for row in ctx.relation.get_bindings()
+                    if filter_fn(world, get_gameobject(row[index]))
+                ]
+            else:
+                valid_bindings = [
+                    row
+                    for row in ctx.relation.get_bindings()
+                    if filter_fn(world, *[get_gameobject(row[i]) for i in indices])
+                ]
 
             return Relation(relation_symbols, valid_bindings)
 
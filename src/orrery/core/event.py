@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from collections import defaultdict
 from typing import (
     Any,
@@ -19,17 +20,25 @@ from orrery.core.serializable import ISerializable
 
 
 class RoleList:
-    """A collection of roles for an event"""
+    """A collection of roles for an event
 
-    __slots__ = "_roles", "_sorted_roles"
+    Attributes
+    ----------
+    _roles: List[EventRole]
+        The roles in the order they were added
+    _gids_by_name: Dict[str, List[int]]
+        The IDs of the GameObjects bound to each role name, in the order
+        they were added
+    """
+
+    __slots__ = "_roles", "_gids_by_name"
 
     def __init__(self, roles: Optional[List[EventRole]] = None) -> None:
-        self._roles: List[EventRole] = []
-        self._sorted_roles: Dict[str, List[EventRole]] = {}
+        self._roles: List[EventRole] = list(roles) if roles else []
+        self._gids_by_name: Dict[str, List[int]] = {}
 
-        if roles:
-            for role in roles:
-                self.add_role(role)
+        for role in self._roles:
+            self._index_role(role)
 
     @property
     def roles(self) -> List[EventRole]:
@@ -38,16 +47,21 @@ class RoleList:
     def add_role(self, role: EventRole) -> None:
         """Add role to the event"""
         self._roles.append(role)
-        if role.name not in self._sorted_roles:
-            self._sorted_roles[role.name] = []
-        self._sorted_roles[role.name].append(role)
+        self._index_role(role)
+
+    def _index_role(self, role: EventRole) -> None:
+        """Record the role's GameObject ID under the role's name"""
+        try:
+            self._gids_by_name[role.name].append(role.gid)
+        except KeyError:
+            self._gids_by_name[role.name] = [role.gid]
 
     def get_all(self, role_name: str) -> List[int]:
         """Return the IDs of all GameObjects bound to the given role name"""
-        return list(map(lambda role: role.gid, self._sorted_roles[role_name]))
+        return list(self._gids_by_name[role_name])
 
     def __getitem__(self, role_name: str) -> int:
-        return self._sorted_roles[role_name][0].gid
+        return self._gids_by_name[role_name][0]
 
     def __iter__(self):
         return self._roles.__iter__()
@@ -140,7 +154,9 @@ class EventRole:
     __slots__ = "name", "gid"
 
     def __init__(self, name: str, gid: int) -> None:
-        self.name: str = name
+        # Role names are interned so lookups by literal role names compare by
+        # identity
+        self.name: str = sys.intern(name)
         self.gid: int = gid
 
     def to_dict(self) -> Dict[str, Any]:
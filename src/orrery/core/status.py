@@ -6,9 +6,7 @@ be paired with systems and updated every timestep and may be used to represent
 temporary states like mood, unemployment, pregnancies, etc.
 """
 from abc import ABC
-from typing import Any, Dict, Iterator, List, Type
-
-from ordered_set import OrderedSet
+from typing import Any, Dict, Iterable, Iterator, List, Type
 
 from orrery.core.ecs import Component
 
@@ -34,13 +32,19 @@ class StatusComponent(Component, ABC):
 
 
 class StatusManager(Component):
-    """Manages the state of statuses attached to the GameObject"""
+    """Manages the state of statuses attached to the GameObject
+
+    Attributes
+    ----------
+    _statuses: Dict[Type[StatusComponent], None]
+        Active status types in the order they were added
+    """
 
     __slots__ = "_statuses"
 
     def __init__(self) -> None:
         super().__init__()
-        self._statuses: OrderedSet[Type[StatusComponent]] = OrderedSet([])
+        self._statuses: Dict[Type[StatusComponent], None] = {}
 
     def get_all(self) -> List[Type[StatusComponent]]:
         """Return all the statuses in the tracker"""
@@ -54,7 +58,7 @@ class StatusManager(Component):
         status_type: Type[Component]
             The status type added to the GameObject
         """
-        self._statuses.add(status_type)
+        self._statuses[status_type] = None
 
     def has(self, status_type: Type[StatusComponent]) -> bool:
         """Check if a status type is active
@@ -69,7 +73,23 @@ class StatusManager(Component):
         bool
             True if the status is present
         """
-        return status_type in self
+        return status_type in self._statuses
+
+    def has_all(self, status_types: Iterable[Type[StatusComponent]]) -> bool:
+        """Check if all the given status types are active
+
+        Parameters
+        ----------
+        status_types: Iterable[Type[Component]]
+            The status types to check for
+
+        Returns
+        -------
+        bool
+            True if every status is present
+        """
+        statuses = self._statuses
+        return all(status_type in statuses for status_type in status_types)
 
     def remove(self, status_type: Type[StatusComponent]) -> None:
         """Remove a status type from the tracker
@@ -78,8 +98,32 @@ class StatusManager(Component):
         ----------
         status_type: Type[Component]
             The status type to be removed from the GameObject
+
+        Throws
+        ------
+        KeyError
+            If the status type is not active
+        """
+        del self._statuses[status_type]
+
+    def discard(self, status_type: Type[StatusComponent]) -> bool:
+        """Remove a status type from the tracker if it is present
+
+        Parameters
+        ----------
+        status_type: Type[Component]
+            The status type to be removed from the GameObject
+
+        Returns
+        -------
+        bool
+            True if the status type was present and has been removed
         """
-        self._statuses.remove(status_type)
+        try:
+            del self._statuses[status_type]
+            return True
+        except KeyError:
+            return False
 
     def clear(self) -> None:
         """Removes all statuses from the tracker gameobject"""
@@ -94,7 +138,7 @@ class StatusManager(Component):
         return self._statuses.__iter__()
 
     def __repr__(self) -> str:
-        return "{}({})".format(self.__class__.__name__, self._statuses)
+        return "{}({})".format(self.__class__.__name__, list(self._statuses))
 
     def to_dict(self) -> Dict[str, Any]:
         return {"statuses": [s.__name__ for s in self._statuses]}
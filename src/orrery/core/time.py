@@ -9,7 +9,7 @@ enums, and helper classes.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from typing import NamedTuple
 
 MIN_YEAR = 1
 MAX_YEAR = 9999
@@ -19,9 +19,12 @@ MONTHS_PER_YEAR = 12
 DAYS_PER_YEAR = DAYS_PER_MONTH * MONTHS_PER_YEAR
 
 
-@dataclass(frozen=True)
-class TimeDelta:
-    """Represents a difference in time from one SimDateTime to Another"""
+class TimeDelta(NamedTuple):
+    """Represents a difference in time from one SimDateTime to Another
+
+    A NamedTuple rather than a frozen dataclass, since deltas are created on
+    every system run and tuples are built without a Python-level __init__
+    """
 
     years: int = 0
     months: int = 0
@@ -112,16 +115,6 @@ class SimDateTime:
         if years < 0:
             raise ValueError("Parameter 'years' may not be negative")
 
-        # total_days: int = self.day + days
-        # carry_months: int = total_days // (DAYS_PER_MONTH + 1)  # 28 days per month
-        # self._day = total_days - (carry_months * DAYS_PER_MONTH)
-        #
-        # total_months: int = self._month + months + carry_months
-        # carry_years: int = total_months // (MONTHS_PER_YEAR + 1)  # 12 months per year
-        # self._month = total_months - (carry_years * MONTHS_PER_YEAR)
-        #
-        # self._year = self._year + years + carry_years
-
         self._days += days + (months * DAYS_PER_MONTH) + (years * DAYS_PER_YEAR)
 
     @property
@@ -144,10 +137,12 @@ class SimDateTime:
         int
             Where 0 = Monday and 6 = Sunday
         """
-        return (self.day - 1) % 7
+        # Months and years are whole weeks long, so the weekday follows
+        # directly from the elapsed days
+        return self._days % 7
 
     def copy(self) -> SimDateTime:
-        return SimDateTime.from_ordinal(self.to_ordinal())
+        return SimDateTime._new_unchecked(self._days)
 
     def __repr__(self) -> str:
         return "{}(day={}, month={}, year={})".format(
@@ -165,16 +160,11 @@ class SimDateTime:
 
     def __sub__(self, other: SimDateTime) -> TimeDelta:
         """Subtract a SimDateTime from another and return the difference"""
-        diff = self._days - other._days
+        # Convert the difference in days back to date components
+        years, remainder = divmod(self._days - other._days, DAYS_PER_YEAR)
+        months, days = divmod(remainder, DAYS_PER_MONTH)
 
-        # Convert hours back to date components
-        years = diff // (MONTHS_PER_YEAR * DAYS_PER_MONTH)
-        remainder = diff % (MONTHS_PER_YEAR * DAYS_PER_MONTH)
-        months = remainder // DAYS_PER_MONTH
-        remainder = remainder % DAYS_PER_MONTH
-        days = remainder
-
-        return TimeDelta(years=years, months=months, days=days)
+        return TimeDelta(years, months, days)
 
     def __add__(self, other: TimeDelta) -> SimDateTime:
         """Add a TimeDelta to this data"""
@@ -187,31 +177,37 @@ class SimDateTime:
         return self
 
     def __le__(self, other: SimDateTime) -> bool:
-        return self.to_ordinal() <= other.to_ordinal()
+        return self._days <= other._days
 
     def __lt__(self, other: SimDateTime) -> bool:
-        return self.to_ordinal() < other.to_ordinal()
+        return self._days < other._days
 
     def __ge__(self, other: SimDateTime) -> bool:
-        return self.to_ordinal() >= other.to_ordinal()
+        return self._days >= other._days
 
     def __gt__(self, other: SimDateTime) -> bool:
-        return self.to_ordinal() > other.to_ordinal()
+        return self._days > other._days
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, SimDateTime):
             raise TypeError(f"expected TimeDelta object but was {type(other)}")
-        return self.to_ordinal() == other.to_ordinal()
+        return self._days == other._days
 
     def __hash__(self) -> int:
         return self._days
 
     def to_date_str(self) -> str:
-        return "{:02d}/{:02d}/{:04d}".format(self.day, self.month, self.year)
+        years, days = divmod(self._days, DAYS_PER_YEAR)
+        months, days = divmod(days, DAYS_PER_MONTH)
+        return "%02d/%02d/%04d" % (days + 1, months + 1, years + 1)
 
     def to_iso_str(self) -> str:
         """Return ISO string format"""
-        return "{:04d}-{:02d}-{:02d}T00:00.000z".format(self.year, self.month, self.day)
+        # Split the day count once and use %-formatting rather than reading
+        # the day/month/year properties into str.format
+        years, days = divmod(self._days, DAYS_PER_YEAR)
+        months, days = divmod(days, DAYS_PER_MONTH)
+        return "%04d-%02d-%02dT00:00.000z" % (years + 1, months + 1, days + 1)
 
     def to_ordinal(self) -> int:
         """Returns the number of elapsed days since 01-01-0000"""
@@ -229,17 +225,39 @@ class SimDateTime:
                 f"Ordinal date must be between 1 and {MAX_YEAR * DAYS_PER_YEAR}"
             )
 
-        total_days = ordinal_date - 1
-        day = ((total_days % DAYS_PER_YEAR) % DAYS_PER_MONTH) + 1
-        month = ((total_days % DAYS_PER_YEAR) // DAYS_PER_MONTH) + 1
-        year = (total_days // DAYS_PER_YEAR) + 1
+        return cls._new_unchecked(ordinal_date - 1)
 
-        return cls(year, month, day)
+    @classmethod
+    def _new_unchecked(cls, days: int) -> SimDateTime:
+        """Create a SimDateTime from a number of elapsed days without validation
+
+        Used internally when the day count is already known to be in range, to
+        skip splitting it into a date only for __init__ to check and sum it again
+        """
+        date = cls.__new__(cls)
+        date._days = days
+        return date
 
     @classmethod
     def from_iso_str(cls, iso_date: str) -> SimDateTime:
         """Create a SimDateTime instance using an ISO-8601 formatted string"""
-        date_time = iso_date.strip().split("T")
+        iso_date = iso_date.strip()
+
+        # Zero-padded YYYY-MM-DD dates, with or without a time part, are read
+        # from their fixed offsets without splitting the string
+        if (
+            len(iso_date) >= 10
+            and iso_date[4] == "-"
+            and iso_date[7] == "-"
+            and (len(iso_date) == 10 or iso_date[10] == "T")
+        ):
+            return cls(
+                year=int(iso_date[0:4]),
+                month=int(iso_date[5:7]),
+                day=int(iso_date[8:10]),
+            )
+
+        date_time = iso_date.split("T")
         date = date_time[0]
         year, month, day = tuple(map(lambda s: int(s.strip()), date.split("-")))
         return cls(year=year, month=month, day=day)
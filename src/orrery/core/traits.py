@@ -9,9 +9,7 @@ and where they choose to frequent within the settlement(s).
 Currently, traits are not in use.
 """
 from abc import ABC
-from typing import Any, Dict, Iterator, List, Set, Type
-
-from ordered_set import OrderedSet
+from typing import Any, Dict, Iterable, Iterator, List, Set, Type
 
 from orrery.core.ecs import Component
 
@@ -33,13 +31,21 @@ class Trait(Component, ABC):
 
 
 class TraitManager(Component):
-    """Manages the state of statuses attached to the GameObject"""
+    """Manages the state of traits attached to the GameObject
+
+    Attributes
+    ----------
+    _traits: Dict[Type[Trait], None]
+        Active trait types in the order they were added
+    _prohibited_traits: Dict[str, Set[str]]
+        Names of prohibited traits mapped to the names of the traits prohibiting them
+    """
 
     __slots__ = "_traits", "_prohibited_traits"
 
     def __init__(self) -> None:
         super().__init__()
-        self._traits: OrderedSet[Type[Trait]] = OrderedSet([])
+        self._traits: Dict[Type[Trait], None] = {}
         self._prohibited_traits: Dict[str, Set[str]] = {}
 
     def get_all(self) -> List[Type[Trait]]:
@@ -61,7 +67,7 @@ class TraitManager(Component):
                 )
             )
 
-        self._traits.add(trait_type)
+        self._traits[trait_type] = None
 
         # Update the prohibited traits list and map the prohibited names
         # to the traits that prohibit them for debugging
@@ -83,7 +89,23 @@ class TraitManager(Component):
         bool
             True if the trait is present
         """
-        return trait_type in self
+        return trait_type in self._traits
+
+    def has_all(self, trait_types: Iterable[Type[Trait]]) -> bool:
+        """Check if all the given trait types are active
+
+        Parameters
+        ----------
+        trait_types: Iterable[Type[Component]]
+            The trait types to check for
+
+        Returns
+        -------
+        bool
+            True if every trait is present
+        """
+        traits = self._traits
+        return all(trait_type in traits for trait_type in trait_types)
 
     def remove(self, trait_type: Type[Trait]) -> None:
         """Remove a trait type from the tracker
@@ -92,8 +114,13 @@ class TraitManager(Component):
         ----------
         trait_type: Type[Component]
             The trait type to be removed from the GameObject
+
+        Throws
+        ------
+        KeyError
+            If the trait type is not active
         """
-        self._traits.remove(trait_type)
+        del self._traits[trait_type]
 
         for trait_name in trait_type.excludes:
             if trait_name in self._prohibited_traits:
@@ -116,7 +143,7 @@ class TraitManager(Component):
         return self._traits.__iter__()
 
     def __repr__(self) -> str:
-        return "{}({})".format(self.__class__.__name__, self._traits)
+        return "{}({})".format(self.__class__.__name__, list(self._traits))
 
     def to_dict(self) -> Dict[str, Any]:
         return {"traits": [t.__name__ for t in self._traits]}
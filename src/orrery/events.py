@@ -80,7 +80,9 @@ class DepartEvent(Event):
         self.reason = reason
 
     def to_dict(self) -> Dict[str, Any]:
-        return {**super().to_dict(), "reason": self.reason}
+        data = super().to_dict()
+        data["reason"] = self.reason
+        return data
 
     def __str__(self) -> str:
         return f"{super().__str__()}, reason={self.reason}"
@@ -186,10 +188,9 @@ class StartJobEvent(Event):
         self.occupation: str = occupation
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            **super().to_dict(),
-            "occupation": self.occupation,
-        }
+        data = super().to_dict()
+        data["occupation"] = self.occupation
+        return data
 
     def __str__(self) -> str:
         return f"{super().__str__()}, occupation={self.occupation}"
@@ -218,11 +219,10 @@ class EndJobEvent(Event):
         self.reason: str = reason
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            **super().to_dict(),
-            "occupation": self.occupation,
-            "reason": self.reason,
-        }
+        data = super().to_dict()
+        data["occupation"] = self.occupation
+        data["reason"] = self.reason
+        return data
 
     def __str__(self) -> str:
         return (
@@ -279,11 +279,10 @@ class StartBusinessEvent(Event):
         self.business_name: str = business_name
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            **super().to_dict(),
-            "occupation": self.occupation,
-            "business_name": self.business_name,
-        }
+        data = super().to_dict()
+        data["occupation"] = self.occupation
+        data["business_name"] = self.business_name
+        return data
 
     def __str__(self) -> str:
         return f"{super().__str__()}, business_name={self.business_name}, occupation={self.occupation}"
@@ -308,10 +307,9 @@ class BusinessOpenEvent(Event):
         self.business_name: str = business_name
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            **super().to_dict(),
-            "business_name": self.business_name,
-        }
+        data = super().to_dict()
+        data["business_name"] = self.business_name
+        return data
 
     def __str__(self) -> str:
         return f"{super().__str__()}, business_name={self.business_name}"
@@ -458,7 +456,6 @@ class RetirementEvent(Event):
         self.occupation: str = occupation
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            **super().to_dict(),
-            "occupation": self.occupation,
-        }
+        data = super().to_dict()
+        data["occupation"] = self.occupation
+        return data
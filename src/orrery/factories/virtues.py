@@ -18,7 +18,7 @@ class VirtuesFactory(IComponentFactory):
         **kwargs: Any,
     ) -> Virtues:
         """Generate a new set of character values"""
-        values_overrides: Dict[str, int] = {}
+        virtues = Virtues()
 
         if initialization == "zeros":
             pass
@@ -28,26 +28,28 @@ class VirtuesFactory(IComponentFactory):
 
             # Select virtues types
             total_virtues: int = n_likes + n_dislikes
-            chosen_virtues = [
-                virtue.name for virtue in rng.sample(list(VirtueType), total_virtues)
-            ]
+            chosen_virtues = rng.sample(list(VirtueType), total_virtues)
 
-            # select likes and dislikes
+            # select likes and dislikes. Dislikes keep the sampled order so the
+            # values drawn for them do not depend on set iteration order
             high_values = rng.sample(chosen_virtues, n_likes)
-            low_values = list(set(chosen_virtues) - set(high_values))
+            low_values = [v for v in chosen_virtues if v not in high_values]
 
             # Generate values for each ([30,50] for high values, [-50,-30] for dislikes)
-            for trait in high_values:
-                values_overrides[trait] = rng.randint(30, 50)
+            # and write them straight into the vector instead of building a dict
+            # of names for Virtues to look up again
+            for virtue in high_values:
+                virtues[virtue] = rng.randint(30, 50)
 
-            for trait in low_values:
-                values_overrides[trait] = rng.randint(-50, -30)
+            for virtue in low_values:
+                virtues[virtue] = rng.randint(-50, -30)
         else:
             # Using an unknown virtue doesn't break anything, but we should log it
             logger.warning(f"Unrecognized Virtues initialization '{initialization}'")
 
         if overrides is not None:
             # Override any values with manually-specified values
-            values_overrides = {**values_overrides, **overrides}
+            for virtue_name, value in overrides.items():
+                virtues[VirtueType[virtue_name]] = value
 
-        return Virtues(values_overrides)
+        return virtues
@@ -396,6 +396,7 @@ class BuildBusinessSystem(ISystem):
         business_library = self.world.get_resource(BusinessLibrary)
         occupation_types = self.world.get_resource(OccupationTypeLibrary)
         rng = self.world.get_resource(random.Random)
+        current_date = self.world.get_resource(SimDateTime)
 
         # Orrery is configured to simulate a single settlement by default. However,
         # we still do a World.get_component call just incase there are multiple
@@ -438,7 +439,7 @@ class BuildBusinessSystem(ISystem):
 
                 event_log.emit(
                     orrery.events.StartBusinessEvent(
-                        self.world.get_resource(SimDateTime),
+                        current_date,
                         owner,
                         business,
                         owner_occupation_type.name,
@@ -720,9 +721,11 @@ class UnemployedStatusSystem(System):
 
     def run(self, *args: Any, **kwargs: Any) -> None:
         current_date = self.world.get_resource(SimDateTime)
+        event_log = self.world.get_resource(EventHandler)
+        elapsed_years = self.elapsed_time.total_days / DAYS_PER_YEAR
         for guid, unemployed in self.world.get_component(Unemployed):
             character = self.world.get_gameobject(guid)
-            unemployed.years += self.elapsed_time.total_days / DAYS_PER_YEAR
+            unemployed.years += elapsed_years
 
             if unemployed.years >= self.years_to_find_a_job:
                 spouses = get_relationships_with_statuses(character, Married)
@@ -762,12 +765,12 @@ class UnemployedStatusSystem(System):
                     remove_status(character, Unemployed)
 
                     event = orrery.events.DepartEvent(
-                        self.world.get_resource(SimDateTime),
+                        current_date,
                         characters_to_depart,
                         "unemployment",
                     )
 
-                    self.world.get_resource(EventHandler).emit(event)
+                    event_log.emit(event)
 
 
 class PregnantStatusSystem(System):
@@ -775,6 +778,7 @@ class PregnantStatusSystem(System):
 
     def run(self, *args: Any, **kwargs: Any) -> None:
         current_date = self.world.get_resource(SimDateTime)
+        event_log = self.world.get_resource(EventHandler)
 
         for guid, pregnant in self.world.get_component(Pregnant):
             character = self.world.get_gameobject(guid)
@@ -864,7 +868,7 @@ class PregnantStatusSystem(System):
 
             # Pregnancy event dates are retro-fit to be the actual date that the
             # child was due.
-            self.world.get_resource(EventHandler).emit(
+            event_log.emit(
                 orrery.events.ChildBirthEvent(
                     current_date, character, other_parent, baby
                 )
@@ -875,16 +879,18 @@ class MarriedStatusSystem(System):
     sys_group = "status-update"
 
     def run(self, *args: Any, **kwargs: Any) -> None:
+        elapsed_years = self.elapsed_time.total_days / DAYS_PER_YEAR
         for _, married in self.world.get_component(Married):
-            married.years += self.elapsed_time.total_days / DAYS_PER_YEAR
+            married.years += elapsed_years
 
 
 class DatingStatusSystem(System):
     sys_group = "status-update"
 
     def run(self, *args: Any, **kwargs: Any) -> None:
+        elapsed_years = self.elapsed_time.total_days / DAYS_PER_YEAR
         for _, dating in self.world.get_component(Dating):
-            dating.years += self.elapsed_time.total_days / DAYS_PER_YEAR
+            dating.years += elapsed_years
 
 
 class RelationshipUpdateSystem(System):
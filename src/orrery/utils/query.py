@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import random
+from functools import lru_cache
 from typing import List, Literal, Optional, Tuple, Type
 
 from orrery.components.business import Occupation, WorkHistory
@@ -303,6 +304,10 @@ def find_relationships_with_statuses(
     return fn
 
 
+# The filter factories below take a single enum or type argument and return
+# stateless closures, so they are memoized. Queries built from the same
+# arguments then share the same filter function.
+@lru_cache(maxsize=None)
 def life_stage_eq(stage: LifeStage) -> QueryFilterFn:
     def fn(world: World, *gameobjects: GameObject) -> bool:
         character = gameobjects[0].try_component(GameCharacter)
@@ -313,6 +318,7 @@ def life_stage_eq(stage: LifeStage) -> QueryFilterFn:
     return fn
 
 
+@lru_cache(maxsize=None)
 def life_stage_ge(stage: LifeStage) -> QueryFilterFn:
     def fn(world: World, *gameobjects: GameObject) -> bool:
         character = gameobjects[0].try_component(GameCharacter)
@@ -323,6 +329,7 @@ def life_stage_ge(stage: LifeStage) -> QueryFilterFn:
     return fn
 
 
+@lru_cache(maxsize=None)
 def life_stage_le(stage: LifeStage) -> QueryFilterFn:
     def fn(world: World, *gameobjects: GameObject) -> bool:
         character = gameobjects[0].try_component(GameCharacter)
@@ -366,6 +373,7 @@ def after_year(year: int) -> QueryFilterFn:
     return fn
 
 
+@lru_cache(maxsize=None)
 def is_gender(gender: Gender) -> QueryFilterFn:
     """Return precondition function that checks if an entity is a given gender"""
 
@@ -420,6 +428,7 @@ def has_work_experience_filter(
     return fn
 
 
+@lru_cache(maxsize=None)
 def has_status_filter(status_type: Type[StatusComponent]) -> QueryFilterFn:
     """Check if a GameObject has the given status present"""
 
@@ -429,6 +438,7 @@ def has_status_filter(status_type: Type[StatusComponent]) -> QueryFilterFn:
     return filter_fn
 
 
+@lru_cache(maxsize=None)
 def has_component_filter(component_type: Type[Component]) -> QueryFilterFn:
     """Return True if the entity has a given component type"""
 
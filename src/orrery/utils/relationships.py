@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Type, TypeVar
+from typing import Dict, Iterable, List, Optional, Tuple, Type, TypeVar
 
 from orrery.components.relationship import (
     Relationship,
@@ -9,18 +9,64 @@ from orrery.components.relationship import (
     RelationshipNotFound,
     RelationshipStat,
 )
-from orrery.config import OrreryConfig
+from orrery.config import OrreryConfig, RelationshipSchema
 from orrery.content_management import SocialRuleLibrary
-from orrery.core.ecs import GameObject
+from orrery.core.ecs import GameObject, World
 from orrery.core.status import StatusComponent, StatusManager
-from orrery.utils.statuses import add_status, has_status, remove_status
+from orrery.utils.statuses import add_status, remove_status
 
 _RST = TypeVar("_RST", bound=StatusComponent)
 
+_StatFactory = Tuple[Tuple[str, int, int, bool], ...]
 
-def add_relationship(subject: GameObject, target: GameObject) -> GameObject:
-    """
-    Creates a new relationship from the subject to the target
+# The relationship schema is fixed for the duration of a simulation, so the
+# stat parameters are flattened once and reused for every new relationship
+_stat_factory_cache: Tuple[Optional[RelationshipSchema], _StatFactory] = (None, ())
+
+# Most social rules return the same values for every pair of characters, so
+# modifiers are shared between relationships instead of allocated per pair.
+# The cache is emptied when it fills up, since rules that compute their values
+# from character attributes can produce an unbounded number of distinct modifiers
+_ModifierKey = Tuple[str, Tuple[Tuple[str, int], ...]]
+_MODIFIER_CACHE_SIZE = 4096
+_modifier_cache: Dict[_ModifierKey, RelationshipModifier] = {}
+
+
+def _stat_factory(schema: RelationshipSchema) -> _StatFactory:
+    """Return (name, min_value, max_value, changes_with_time) for each schema stat"""
+    global _stat_factory_cache
+
+    cached_schema, stat_factory = _stat_factory_cache
+
+    if cached_schema is not schema:
+        stat_factory = tuple(
+            (name, config.min_value, config.max_value, config.changes_with_time)
+            for name, config in schema.stats.items()
+        )
+        _stat_factory_cache = (schema, stat_factory)
+
+    return stat_factory
+
+
+def _get_modifier(name: str, values: Dict[str, int]) -> RelationshipModifier:
+    """Return a shared RelationshipModifier with the given name and values"""
+    key = (name, tuple(sorted(values.items())))
+
+    try:
+        return _modifier_cache[key]
+    except KeyError:
+        if len(_modifier_cache) >= _MODIFIER_CACHE_SIZE:
+            _modifier_cache.clear()
+
+        modifier = RelationshipModifier(name=name, values=values)
+        _modifier_cache[key] = modifier
+        return modifier
+
+
+def _spawn_relationship(subject: GameObject, target: GameObject) -> GameObject:
+    """Create a relationship GameObject and register it with the subject
+
+    Social rules are not evaluated for the new relationship.
 
     Parameters
     ----------
@@ -31,8 +77,8 @@ def add_relationship(subject: GameObject, target: GameObject) -> GameObject:
 
     Returns
     -------
-    Relationship
-        The new relationship instance
+    GameObject
+        The GameObject holding the new Relationship and its statuses
     """
     world = subject.world
     schema = world.get_resource(OrreryConfig).relationship_schema
@@ -43,27 +89,131 @@ def add_relationship(subject: GameObject, target: GameObject) -> GameObject:
                 owner=subject.uid,
                 target=target.uid,
                 stats={
-                    name: RelationshipStat(
-                        min_value=config.min_value,
-                        max_value=config.max_value,
-                        changes_with_time=config.changes_with_time,
+                    name: RelationshipStat(min_value, max_value, changes_with_time)
+                    for name, min_value, max_value, changes_with_time in _stat_factory(
+                        schema
                     )
-                    for name, config in schema.stats.items()
                 },
             ),
             StatusManager(),
         ]
     )
 
+    add_relationship_ref(subject, target, relationship)
+    subject.add_child(relationship)
+
+    return relationship
+
+
+def add_relationship(subject: GameObject, target: GameObject) -> GameObject:
+    """
+    Creates a new relationship from the subject to the target
+
+    Parameters
+    ----------
+    subject: GameObject
+        The GameObject that owns the relationship
+    target: GameObject
+        The GameObject that the Relationship is directed toward
+
+    Returns
+    -------
+    Relationship
+        The new relationship instance
+    """
+    relationship = _spawn_relationship(subject, target)
+
+    reevaluate_social_rules(relationship, subject, target)
+
+    return relationship
+
+
+def add_relationship_ref(
+    subject: GameObject, target: GameObject, relationship: GameObject
+) -> None:
+    """
+    Record an existing relationship GameObject in the subject's RelationshipManager
+
+    Unlike add_relationship, this does not make the relationship a child of the
+    subject, so it will not be removed from the world along with the subject.
+    Callers that need that lifecycle coupling should call subject.add_child().
+
+    Parameters
+    ----------
+    subject: GameObject
+        The GameObject that owns the relationship
+    target: GameObject
+        The GameObject that the Relationship is directed toward
+    relationship: GameObject
+        The GameObject holding the Relationship component
+    """
     subject.get_component(RelationshipManager).relationships[
         target.uid
     ] = relationship.uid
 
-    subject.add_child(relationship)
 
-    reevaluate_social_rules(relationship, subject, target)
+def add_relationships_bulk(
+    subject: GameObject, targets: Iterable[GameObject]
+) -> List[GameObject]:
+    """
+    Creates new relationships from the subject to each of the targets
 
-    return relationship
+    This produces the same result as calling add_relationship for each target,
+    but the active social rules are only resolved once, and rules that the
+    subject fails as an initiator are not rechecked per target.
+    Use it when initializing many relationships at once.
+
+    Targets that the subject already has a relationship with, including targets
+    repeated in the input, are not given a new relationship. The existing
+    relationship is returned in their place and its social rules are not re-run.
+
+    Parameters
+    ----------
+    subject: GameObject
+        The GameObject that owns the relationships
+    targets: Iterable[GameObject]
+        The GameObjects that the relationships are directed toward
+
+    Returns
+    -------
+    List[GameObject]
+        The relationship instances, in the same order as the targets
+    """
+    world = subject.world
+    rule_library = world.get_resource(SocialRuleLibrary)
+    social_rules = [
+        rule
+        for rule in rule_library.get_active_rules()
+        if rule.check_initiator(subject) is not False
+    ]
+
+    existing_ids = subject.get_component(RelationshipManager).relationships
+    relationships: List[GameObject] = []
+    new_relationships: List[GameObject] = []
+    new_targets: List[GameObject] = []
+
+    for target in targets:
+        relationship_id = existing_ids.get(target.uid)
+
+        if relationship_id is not None:
+            relationships.append(world.get_gameobject(relationship_id))
+            continue
+
+        relationship = _spawn_relationship(subject, target)
+        relationships.append(relationship)
+        new_relationships.append(relationship)
+        new_targets.append(target)
+
+    for relationship, target in zip(new_relationships, new_targets):
+        relationship.get_component(Relationship).replace_modifiers(
+            [
+                _get_modifier(rule.get_rule_name(), rule.evaluate(subject, target))
+                for rule in social_rules
+                if rule.check_target(target) is not False
+            ]
+        )
+
+    return relationships
 
 
 def get_relationship_entity(
@@ -72,6 +222,8 @@ def get_relationship_entity(
 ) -> GameObject:
     """Return the entity containing the relationship from the subject to the target
 
+    A new relationship is created if one does not already exist.
+
     Parameters
     ----------
     subject: GameObject
@@ -81,23 +233,10 @@ def get_relationship_entity(
 
     Returns
     -------
-    Relationship
-        The relationship instance toward the other entity
-
-    Throws
-    ------
-    KeyError
-        If no relationship is found for the given target and create_new is False
+    GameObject
+        The GameObject holding the relationship toward the other entity
     """
-    if not has_relationship(subject, target):
-        relationship = add_relationship(subject, target)
-
-    else:
-        relationship = subject.world.get_gameobject(
-            subject.get_component(RelationshipManager).relationships[target.uid]
-        )
-
-    return relationship
+    return _resolve_relationship(subject, target)
 
 
 def get_relationship(
@@ -124,7 +263,7 @@ def get_relationship(
 
     Throws
     ------
-    KeyError
+    RelationshipNotFound
         If no relationship is found for the given target and create_new is False
     """
     try:
@@ -159,6 +298,33 @@ def has_relationship(subject: GameObject, target: GameObject) -> bool:
     return target.uid in subject.get_component(RelationshipManager).relationships
 
 
+def _resolve_relationship(subject: GameObject, target: GameObject) -> GameObject:
+    """Get the relationship GameObject using a single RelationshipManager lookup
+
+    A new relationship is created if one does not already exist.
+
+    Parameters
+    ----------
+    subject: GameObject
+        The owner of the relationship
+    target: GameObject
+        The GameObject the relationship is directed toward
+
+    Returns
+    -------
+    GameObject
+        The GameObject holding the Relationship and its statuses
+    """
+    relationship_id = subject.get_component(RelationshipManager).relationships.get(
+        target.uid
+    )
+
+    if relationship_id is not None:
+        return subject.world.get_gameobject(relationship_id)
+
+    return add_relationship(subject, target)
+
+
 def add_relationship_status(
     subject: GameObject, target: GameObject, status: StatusComponent
 ) -> None:
@@ -174,7 +340,7 @@ def add_relationship_status(
     status: Status
         The core component of the status
     """
-    relationship = get_relationship_entity(subject, target)
+    relationship = _resolve_relationship(subject, target)
     add_status(relationship, status)
 
 
@@ -197,7 +363,7 @@ def get_relationship_status(
         The type of the status
     """
 
-    relationship = get_relationship_entity(subject, target)
+    relationship = _resolve_relationship(subject, target)
     return relationship.get_component(status_type)
 
 
@@ -219,7 +385,7 @@ def remove_relationship_status(
         The type of the relationship status to remove
     """
 
-    relationship = get_relationship_entity(subject, target)
+    relationship = _resolve_relationship(subject, target)
     remove_status(relationship, status_type)
 
 
@@ -245,8 +411,8 @@ def has_relationship_status(
         Returns True if relationship has a given status
     """
 
-    relationship = get_relationship_entity(subject, target)
-    return all([has_status(relationship, s) for s in status_type])
+    relationship = _resolve_relationship(subject, target)
+    return _all_statuses(relationship, status_type)
 
 
 def get_relationships_with_statuses(
@@ -266,30 +432,78 @@ def get_relationships_with_statuses(
     List[Relationship]
         Relationships with the given status types
     """
-    world = subject.world
+    get_gameobject = subject.world.get_gameobject
     relationship_manager = subject.get_component(RelationshipManager)
-    matches: List[Relationship] = []
-    for target_id, rel_id in relationship_manager.relationships.items():
-        relationship = world.get_gameobject(rel_id)
-        target = world.get_gameobject(target_id)
-        if has_relationship_status(subject, target, *status_types):
-            matches.append(relationship.get_component(Relationship))
-    return matches
+    # Check the statuses on the relationships directly instead of going through
+    # has_relationship_status(), which would look up the target and then the
+    # relationship again from the subject's manager
+    return [
+        relationship.get_component(Relationship)
+        for relationship in map(
+            get_gameobject, relationship_manager.relationships.values()
+        )
+        if _all_statuses(relationship, status_types)
+    ]
+
+
+def get_all_relationships_with_statuses(
+    world: World, *status_types: Type[StatusComponent]
+) -> List[Relationship]:
+    """Get every relationship in the world that has the given status types
+
+    Statuses are components on the relationship GameObjects, so this is a
+    single component query instead of a walk over each character's
+    RelationshipManager.
+
+    Parameters
+    ----------
+    world: World
+        The world to search
+    *status_types: Type[Component]
+        Status types to check for on relationship instances
+
+    Returns
+    -------
+    List[Relationship]
+        Relationships with the given status types
+    """
+    return [
+        components[0]
+        for _, components in world.get_components((Relationship, *status_types))
+    ]
+
+
+def _all_statuses(
+    relationship: GameObject, status_types: Tuple[Type[StatusComponent], ...]
+) -> bool:
+    """Check that a relationship has every status in an already packed tuple"""
+    return relationship.get_component(StatusManager).has_all(status_types)
 
 
 def reevaluate_social_rules(
     relationship: GameObject, subject: GameObject, target: GameObject
 ) -> None:
-    social_rules = subject.world.get_resource(SocialRuleLibrary).get_active_rules()
+    """Replace the social rule modifiers on a relationship with freshly evaluated ones
 
-    for rule in social_rules:
-        if rule.check_initiator(subject) is False:
-            continue
-        if rule.check_target(target) is False:
-            continue
+    Social rules may read any component value on the subject or target, so they
+    are always re-run. The previous modifiers are removed before the new ones are
+    applied so that repeated evaluations do not stack.
 
-        relationship.get_component(Relationship).add_modifier(
-            RelationshipModifier(
-                name=rule.get_rule_name(), values=rule.evaluate(subject, target)
-            )
-        )
+    Parameters
+    ----------
+    relationship: GameObject
+        The GameObject holding the relationship
+    subject: GameObject
+        The owner of the relationship
+    target: GameObject
+        The GameObject the relationship is directed toward
+    """
+    rule_library = subject.world.get_resource(SocialRuleLibrary)
+    relationship.get_component(Relationship).replace_modifiers(
+        [
+            _get_modifier(rule.get_rule_name(), rule.evaluate(subject, target))
+            for rule in rule_library.get_active_rules()
+            if rule.check_initiator(subject) is not False
+            and rule.check_target(target) is not False
+        ]
+    )
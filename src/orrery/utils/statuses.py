@@ -51,9 +51,8 @@ def remove_status(gameobject: GameObject, status_type: Type[StatusComponent]) ->
     status_type: Type[StatusComponentBase]
         The status type to remove
     """
-    if has_status(gameobject, status_type):
+    if gameobject.get_component(StatusManager).discard(status_type):
         gameobject.remove_component(status_type)
-        gameobject.get_component(StatusManager).remove(status_type)
 
 
 def has_status(gameobject: GameObject, status_type: Type[StatusComponent]) -> bool:
@@ -85,8 +84,11 @@ def clear_statuses(gameobject: GameObject) -> None:
     gameobject: GameObject
         The GameObject to clear statuses from
     """
-    status_tracker = gameobject.get_component(StatusManager)
-    statuses_to_remove = status_tracker.get_all()
+    # Every tracked status is removed, so there is no need to go through
+    # remove_status() and look up the manager again for each one
+    status_manager = gameobject.get_component(StatusManager)
 
-    for status_type in statuses_to_remove:
-        remove_status(gameobject, status_type)
+    for status_type in status_manager.get_all():
+        gameobject.remove_component(status_type)
+
+    status_manager.clear()
@@ -1,3 +1,5 @@
+import pytest
+
 from orrery.components.activity import Activities, LikedActivities
 from orrery.components.virtues import VirtueType
 from orrery.content_management import ActivityLibrary, ActivityToVirtueMap
@@ -172,3 +174,54 @@ def test_activity_virtue_map() -> None:
         ]
         == 0
     )
+
+
+def test_get_activity_with_different_spellings() -> None:
+    activity_library = ActivityLibrary()
+    running = activity_library.get("RUNNING")
+
+    assert activity_library.get("RUNNING") is running
+    assert activity_library.get("Running", create_new=False) is running
+    assert len(list(activity_library)) == 1
+
+
+def test_shared_activities_mask() -> None:
+    activity_library = ActivityLibrary()
+    running = activity_library.get("Running")
+    eating = activity_library.get("Eating")
+    drinking = activity_library.get("Drinking")
+
+    available = Activities({running, eating})
+    liked = LikedActivities({eating, drinking})
+
+    assert eating in liked
+    assert running not in liked
+    assert available.mask & liked.mask == 1 << eating.uid
+
+
+def test_liked_activities_are_read_only() -> None:
+    activity_library = ActivityLibrary()
+    running = activity_library.get("Running")
+    eating = activity_library.get("Eating")
+
+    source = {eating}
+    liked = LikedActivities(source)
+    source.add(running)
+
+    assert running not in liked
+    assert liked.activities == frozenset({eating})
+
+    with pytest.raises(AttributeError):
+        liked.activities.add(running)  # type: ignore
+
+
+def test_activities_from_generator() -> None:
+    activity_library = ActivityLibrary()
+    running = activity_library.get("Running")
+    eating = activity_library.get("Eating")
+
+    liked = LikedActivities(a for a in (running,))
+
+    assert running in liked
+    assert eating not in liked
+    assert "running" not in liked  # type: ignore
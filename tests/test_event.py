@@ -56,3 +56,16 @@ def test_life_event_get_item(sample_event: Event):
 def test_life_event_get_item_raises_key_error(sample_event: Event):
     with pytest.raises(KeyError):
         assert sample_event["Clerk"]
+
+
+def test_life_event_add_role(shared_role_event: Event):
+    shared_role_event.add_role(EventRole("Actor", 3))
+    shared_role_event.add_role(EventRole("Witness", 4))
+
+    actors = shared_role_event.get_all("Actor")
+    assert actors == [1, 2, 3]
+    assert shared_role_event["Witness"] == 4
+
+    # Modifying the returned list should not affect the event
+    actors.append(5)
+    assert shared_role_event.get_all("Actor") == [1, 2, 3]
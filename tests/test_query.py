@@ -5,7 +5,7 @@ import pytest
 from orrery.components.character import GameCharacter, Gender, Retired
 from orrery.config import CharacterAgingConfig, CharacterConfig, CharacterSpawnConfig
 from orrery.core.ecs import Component, World
-from orrery.core.ecs.query import QueryBuilder, Relation
+from orrery.core.ecs.query import QueryBuilder, Relation, SymbolsNotInRelation
 from orrery.core.time import SimDateTime
 from orrery.utils.query import is_gender
 
@@ -54,6 +54,15 @@ def test_relation_get_tuples():
     assert r1.get_tuples() == [(1, 4)]
 
 
+def test_relation_get_as_tuple():
+    r0 = Relation(("Hero", "DemonKing"), [(1, 3), (1, 4), (1, 5)])
+    assert r0.get_as_tuple(1, "DemonKing", "Hero") == (4, 1)
+    assert r0.get_as_tuple(slice(0, 2), "DemonKing") == [(3,), (4,)]
+
+    with pytest.raises(SymbolsNotInRelation):
+        r0.get_as_tuple(0, "Sidekick")
+
+
 def test_relation_unify():
 
     r0 = Relation.create_empty()
@@ -86,6 +95,18 @@ def test_relation_unify():
     assert r2.unify(r3).get_tuples() == [(1, 4, 5), (1, 4, 3), (2, 6, 5), (2, 6, 3)]
 
 
+def test_relation_unify_multiple_shared_symbols():
+    r0 = Relation(("Hero", "Rival", "Town"), [(1, 2, 7), (1, 3, 8), (4, 2, 7)])
+    r1 = Relation(("Town", "Hero"), [(7, 1), (7, 4), (8, 5)])
+    r2 = Relation(("Hero", "Town", "Mentor"), [(1, 7, 9), (1, 7, 10), (4, 7, 11)])
+
+    assert r0.unify(r1).get_symbols() == ("Hero", "Rival", "Town")
+    assert r0.unify(r1).get_tuples() == [(1, 2, 7), (4, 2, 7)]
+
+    assert r0.unify(r2).get_symbols() == ("Hero", "Rival", "Town", "Mentor")
+    assert r0.unify(r2).get_tuples() == [(1, 2, 7, 9), (1, 2, 7, 10), (4, 2, 7, 11)]
+
+
 def test_relation_copy():
     r0 = Relation.create_empty()
     r1 = r0.copy()
@@ -167,6 +188,27 @@ def test_with(sample_world: World):
     assert result == expected
 
 
+def test_with_results_update_after_component_changes(sample_world: World):
+    query = QueryBuilder().with_((Hero,)).build()
+    assert set(query.execute(sample_world)) == {(1,), (2,)}
+
+    hero = sample_world.spawn_gameobject([Hero()])
+    assert set(query.execute(sample_world)) == {(1,), (2,), (hero.uid,)}
+
+    hero.remove_component(Hero)
+    assert set(query.execute(sample_world)) == {(1,), (2,)}
+
+
+def test_with_results_are_per_world(sample_world: World):
+    query = QueryBuilder().with_((Hero,)).build()
+    other_world = World()
+    other_world.spawn_gameobject([Hero()])
+
+    assert set(query.execute(sample_world)) == {(1,), (2,)}
+    assert set(query.execute(other_world)) == {(1,)}
+    assert set(query.execute(sample_world)) == {(1,), (2,)}
+
+
 # def test_without(sample_world: World):
 #     query = QueryBuilder().with_((Hero,)).without_((Retired,)).build()
 #     result = set(query.execute(sample_world))
@@ -249,3 +291,8 @@ def test_filter(sample_world: World):
         QueryBuilder("X", "Y").filter_(
             lambda world, *gameobjects: gameobjects[0] == gameobjects[1], "X", "Y"
         ).build().execute(sample_world)
+
+
+def test_is_gender_is_memoized():
+    assert is_gender(Gender.NonBinary) is is_gender(Gender.NonBinary)
+    assert is_gender(Gender.NonBinary) is not is_gender(Gender.Female)
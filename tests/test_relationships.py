@@ -0,0 +1,304 @@
+"""
+test_relationships.py
+
+Tests orrery.utils.relationships
+"""
+from typing import Any, Dict
+
+import pytest
+
+from orrery.components.relationship import (
+    Relationship,
+    RelationshipManager,
+    RelationshipModifier,
+    RelationshipNotFound,
+    RelationshipStatNotfound,
+)
+from orrery.config import OrreryConfig, RelationshipSchema, RelationshipStatConfig
+from orrery.content_management import SocialRuleLibrary
+from orrery.core.ecs import Component, GameObject, World
+from orrery.core.social_rule import ISocialRule, SocialRule
+from orrery.core.status import StatusComponent, StatusManager
+from orrery.orrery import Orrery
+from orrery.utils.relationships import (
+    add_relationship,
+    add_relationship_ref,
+    add_relationship_status,
+    add_relationships_bulk,
+    get_all_relationships_with_statuses,
+    get_relationship,
+    get_relationship_entity,
+    get_relationships_with_statuses,
+    has_relationship,
+    has_relationship_status,
+    reevaluate_social_rules,
+    remove_relationship_status,
+)
+from orrery.utils.statuses import add_status
+
+
+class Friends(StatusComponent):
+    pass
+
+
+class Rivals(StatusComponent):
+    pass
+
+
+@pytest.fixture
+def sample_world() -> World:
+    sim = Orrery(
+        OrreryConfig(
+            relationship_schema=RelationshipSchema(
+                stats={
+                    "Friendship": RelationshipStatConfig(),
+                    "Romance": RelationshipStatConfig(min_value=-50, max_value=50),
+                }
+            )
+        )
+    )
+
+    sim.world.get_resource(SocialRuleLibrary).add(
+        SocialRule("friendly", lambda g: True, lambda g: True, {"Friendship": 5})
+    )
+
+    return sim.world
+
+
+def create_character(world: World) -> GameObject:
+    return world.spawn_gameobject([RelationshipManager(), StatusManager()])
+
+
+def test_add_relationship(sample_world: World) -> None:
+    subject = create_character(sample_world)
+    target = create_character(sample_world)
+
+    assert has_relationship(subject, target) is False
+
+    relationship = add_relationship(subject, target)
+
+    assert has_relationship(subject, target) is True
+    assert has_relationship(target, subject) is False
+    assert relationship in subject.children
+    assert get_relationship(subject, target)["Friendship"].get_raw_value() == 5
+    assert get_relationship(subject, target)["Romance"].get_scaled_value() == 0
+
+
+def test_relationship_stats_are_independent(sample_world: World) -> None:
+    subject = create_character(sample_world)
+    target_0 = create_character(sample_world)
+    target_1 = create_character(sample_world)
+
+    add_relationship(subject, target_0)
+    add_relationship(subject, target_1)
+
+    get_relationship(subject, target_0)["Romance"] += 4
+
+    assert get_relationship(subject, target_0)["Romance"].get_raw_value() == 4
+    assert get_relationship(subject, target_1)["Romance"].get_raw_value() == 0
+
+
+def test_get_relationship(sample_world: World) -> None:
+    subject = create_character(sample_world)
+    target = create_character(sample_world)
+
+    with pytest.raises(RelationshipNotFound):
+        get_relationship(subject, target)
+
+    relationship = get_relationship(subject, target, create_new=True)
+    assert relationship.owner == subject.uid
+    assert relationship.target == target.uid
+
+
+def test_add_relationships_bulk(sample_world: World) -> None:
+    subject = create_character(sample_world)
+    targets = [create_character(sample_world) for _ in range(3)]
+
+    relationships = add_relationships_bulk(subject, targets)
+
+    assert len(relationships) == 3
+    for relationship, target in zip(relationships, targets):
+        assert has_relationship(subject, target) is True
+        assert relationship.parent == subject
+        assert relationship in subject.children
+        assert get_relationship(subject, target).target == target.uid
+        assert get_relationship(subject, target)["Friendship"].get_raw_value() == 5
+
+
+def test_add_relationships_bulk_existing(sample_world: World) -> None:
+    subject = create_character(sample_world)
+    target_0 = create_character(sample_world)
+    target_1 = create_character(sample_world)
+    existing = add_relationship(subject, target_0)
+
+    relationships = add_relationships_bulk(subject, [target_0, target_1, target_1])
+
+    assert relationships[0] == existing
+    assert relationships[1] == relationships[2]
+    assert len(subject.children) == 2
+    assert len(sample_world.get_component(Relationship)) == 2
+    assert get_relationship_entity(subject, target_1) == relationships[1]
+
+
+def test_relationship_statuses(sample_world: World) -> None:
+    subject = create_character(sample_world)
+    target_0 = create_character(sample_world)
+    target_1 = create_character(sample_world)
+
+    add_relationship_status(subject, target_0, Friends(""))
+    add_relationship_status(subject, target_1, Friends(""))
+    add_relationship_status(subject, target_1, Rivals(""))
+
+    assert has_relationship_status(subject, target_0, Friends) is True
+    assert has_relationship_status(subject, target_0, Friends, Rivals) is False
+    assert has_relationship_status(subject, target_1, Friends, Rivals) is True
+
+    matches = get_relationships_with_statuses(subject, Friends)
+    assert {r.target for r in matches} == {target_0.uid, target_1.uid}
+
+    matches = get_relationships_with_statuses(subject, Friends, Rivals)
+    assert [r.target for r in matches] == [target_1.uid]
+
+    remove_relationship_status(subject, target_1, Rivals)
+
+    assert has_relationship_status(subject, target_1, Rivals) is False
+    assert get_relationships_with_statuses(subject, Rivals) == []
+
+
+def test_reevaluate_social_rules(sample_world: World) -> None:
+    subject = create_character(sample_world)
+    target = create_character(sample_world)
+
+    relationship = add_relationship(subject, target)
+
+    reevaluate_social_rules(relationship, subject, target)
+    assert get_relationship(subject, target)["Friendship"].get_raw_value() == 5
+
+    # Re-running the rules replaces the previous modifiers instead of stacking
+    # on top of them
+    add_status(target, Friends(""))
+    reevaluate_social_rules(relationship, subject, target)
+    assert get_relationship(subject, target)["Friendship"].get_raw_value() == 5
+    assert len(get_relationship(subject, target).modifiers) == 1
+
+
+class Mood(Component):
+    def __init__(self, value: int) -> None:
+        super().__init__()
+        self.value: int = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"value": self.value}
+
+
+class MoodRule(ISocialRule):
+    def get_rule_name(self) -> str:
+        return "mood"
+
+    def check_initiator(self, gameobject: GameObject) -> bool:
+        return True
+
+    def check_target(self, gameobject: GameObject) -> bool:
+        return gameobject.has_component(Mood)
+
+    def evaluate(self, initiator: GameObject, target: GameObject) -> Dict[str, int]:
+        return {"Romance": target.get_component(Mood).value}
+
+
+def test_reevaluate_social_rules_after_value_change(sample_world: World) -> None:
+    sample_world.get_resource(SocialRuleLibrary).add(MoodRule())
+    subject = create_character(sample_world)
+    target = create_character(sample_world)
+    target.add_component(Mood(5))
+
+    relationship = add_relationship(subject, target)
+    assert get_relationship(subject, target)["Romance"].get_raw_value() == 5
+
+    # Rules see changes to component values, not only added or removed components
+    target.get_component(Mood).value = -5
+    reevaluate_social_rules(relationship, subject, target)
+    assert get_relationship(subject, target)["Romance"].get_raw_value() == -5
+
+
+def test_get_relationship_entity(sample_world: World) -> None:
+    subject = create_character(sample_world)
+    target = create_character(sample_world)
+
+    relationship = get_relationship_entity(subject, target)
+
+    assert has_relationship(subject, target) is True
+    assert get_relationship_entity(subject, target) == relationship
+    assert len(subject.children) == 1
+
+
+def test_add_relationship_ref(sample_world: World) -> None:
+    subject = create_character(sample_world)
+    target = create_character(sample_world)
+    relationship = sample_world.spawn_gameobject(
+        [Relationship(owner=subject.uid, target=target.uid, stats={}), StatusManager()]
+    )
+
+    add_relationship_ref(subject, target, relationship)
+
+    assert has_relationship(subject, target) is True
+    assert get_relationship(subject, target) == relationship.get_component(Relationship)
+    assert relationship.parent is None
+    assert relationship not in subject.children
+
+
+def test_get_all_relationships_with_statuses(sample_world: World) -> None:
+    character_0 = create_character(sample_world)
+    character_1 = create_character(sample_world)
+    character_2 = create_character(sample_world)
+
+    add_relationship_status(character_0, character_1, Friends(""))
+    add_relationship_status(character_1, character_2, Friends(""))
+    add_relationship_status(character_1, character_2, Rivals(""))
+    add_relationship(character_2, character_0)
+
+    matches = get_all_relationships_with_statuses(sample_world, Friends)
+    assert {(r.owner, r.target) for r in matches} == {
+        (character_0.uid, character_1.uid),
+        (character_1.uid, character_2.uid),
+    }
+
+    matches = get_all_relationships_with_statuses(sample_world, Friends, Rivals)
+    assert [(r.owner, r.target) for r in matches] == [
+        (character_1.uid, character_2.uid)
+    ]
+
+
+def test_social_rule_modifiers_are_shared(sample_world: World) -> None:
+    subject = create_character(sample_world)
+    target_0 = create_character(sample_world)
+    target_1 = create_character(sample_world)
+
+    add_relationship(subject, target_0)
+    add_relationship(subject, target_1)
+
+    modifier_0 = get_relationship(subject, target_0).modifiers[0]
+    modifier_1 = get_relationship(subject, target_1).modifiers[0]
+    assert modifier_0 is modifier_1
+    assert modifier_0.values == {"Friendship": 5}
+
+    with pytest.raises(TypeError):
+        modifier_0.values["Friendship"] = 10  # type: ignore
+
+
+def test_replace_modifiers_with_unknown_stat(sample_world: World) -> None:
+    subject = create_character(sample_world)
+    target = create_character(sample_world)
+    add_relationship(subject, target)
+    relationship = get_relationship(subject, target)
+
+    with pytest.raises(RelationshipStatNotfound):
+        relationship.replace_modifiers(
+            [
+                RelationshipModifier("romantic", {"Romance": 3}),
+                RelationshipModifier("unknown", {"Rivalry": 2}),
+            ]
+        )
+
+    assert relationship["Friendship"].get_raw_value() == 5
+    assert relationship["Romance"].get_raw_value() == 0
+    assert [m.name for m in relationship.modifiers] == ["friendly"]
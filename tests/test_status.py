@@ -6,13 +6,15 @@ TODO: Fill in the placeholder tests with actual tests
 from dataclasses import dataclass
 from typing import Any, Dict
 
+import pytest
+
 from orrery.core.ecs import Component, World
 from orrery.core.status import StatusComponent, StatusManager
 from orrery.core.time import SimDateTime
 from orrery.utils.statuses import add_status, remove_status
 
 
-@dataclass
+@dataclass(slots=True)
 class Stats(Component):
     strength: int = 0
     defense: int = 0
@@ -97,3 +99,56 @@ def test_contains_status() -> None:
 def test_iter_statuses() -> None:
     """Test calling the StatusManager.__iter__ method"""
     assert False
+
+
+def test_discard_status() -> None:
+    """Test calling the StatusManager.discard method"""
+    status_manager = StatusManager()
+    status_manager.add(SuperStrength)
+
+    assert status_manager.discard(SuperStrength) is True
+    assert SuperStrength not in status_manager
+    assert status_manager.discard(SuperStrength) is False
+
+
+def test_has_all_statuses() -> None:
+    """Test calling the StatusManager.has_all method"""
+    status_manager = StatusManager()
+
+    assert status_manager.has_all(()) is True
+    assert status_manager.has_all((SuperStrength,)) is False
+
+    status_manager.add(SuperStrength)
+
+    assert status_manager.has_all((SuperStrength,)) is True
+
+
+class Weakened(StatusComponent):
+    pass
+
+
+def test_status_manager_order() -> None:
+    """Test that StatusManager keeps statuses in the order they were added"""
+    status_manager = StatusManager()
+    status_manager.add(Weakened)
+    status_manager.add(SuperStrength)
+
+    assert list(status_manager) == [Weakened, SuperStrength]
+    assert status_manager.to_dict() == {"statuses": ["Weakened", "SuperStrength"]}
+
+    status_manager.remove(Weakened)
+
+    assert status_manager.get_all() == [SuperStrength]
+    with pytest.raises(KeyError):
+        status_manager.remove(Weakened)
+
+
+def test_status_manager_unregistered_type() -> None:
+    """Test that non-status types are reported as absent"""
+    status_manager = StatusManager()
+    status_manager.add(SuperStrength)
+
+    assert Stats not in status_manager
+    assert status_manager.has(Stats) is False  # type: ignore
+    assert status_manager.has_all((SuperStrength, Stats)) is False  # type: ignore
+    assert status_manager.discard(Stats) is False  # type: ignore
@@ -2,6 +2,12 @@ import pytest
 
 from orrery.core.time import SimDateTime, TimeDelta
 
+# Shared dates for the comparison tests. These tests only read them, so they
+# are built once instead of in every assertion.
+D_EPOCH = SimDateTime(1, 1, 1)
+D_2K = SimDateTime(2000, 1, 1)
+D_3K = SimDateTime(3000, 1, 1)
+
 
 def test_copy():
     original_date = SimDateTime(1, 1, 1)
@@ -22,6 +28,10 @@ def test__sub__():
     assert diff.years == 0
     assert diff.months == 1
     assert diff.total_days == 28
+    assert diff == TimeDelta(months=1)
+
+    with pytest.raises(AttributeError):
+        diff.days = 3  # type: ignore
 
 
 def test__add__():
@@ -41,34 +51,34 @@ def test__iadd__():
 
 
 def test__le__():
-    assert (SimDateTime(1, 1, 1) <= SimDateTime(1, 1, 1)) is True
-    assert (SimDateTime(1, 1, 1) <= SimDateTime(2000, 1, 1)) is True
-    assert (SimDateTime(3000, 1, 1) <= SimDateTime(1, 1, 1)) is False
+    assert (D_EPOCH <= D_EPOCH) is True
+    assert (D_EPOCH <= D_2K) is True
+    assert (D_3K <= D_EPOCH) is False
 
 
 def test__lt__():
-    assert (SimDateTime(1, 1, 1) < SimDateTime(1, 1, 1)) is False
-    assert (SimDateTime(1, 1, 1) < SimDateTime(2000, 1, 1)) is True
-    assert (SimDateTime(3000, 1, 1) < SimDateTime(1, 1, 1)) is False
+    assert (D_EPOCH < D_EPOCH) is False
+    assert (D_EPOCH < D_2K) is True
+    assert (D_3K < D_EPOCH) is False
 
 
 def test__ge__():
-    assert (SimDateTime(1, 1, 1) >= SimDateTime(1, 1, 1)) is True
-    assert (SimDateTime(1, 1, 1) >= SimDateTime(2000, 1, 1)) is False
-    assert (SimDateTime(3000, 1, 1) >= SimDateTime(1, 1, 1)) is True
+    assert (D_EPOCH >= D_EPOCH) is True
+    assert (D_EPOCH >= D_2K) is False
+    assert (D_3K >= D_EPOCH) is True
 
 
 def test__gt__():
-    assert (SimDateTime(1, 1, 1) > SimDateTime(1, 1, 1)) is False
-    assert (SimDateTime(1, 1, 1) > SimDateTime(2000, 1, 1)) is False
-    assert (SimDateTime(3000, 1, 1) > SimDateTime(1, 1, 1)) is True
+    assert (D_EPOCH > D_EPOCH) is False
+    assert (D_EPOCH > D_2K) is False
+    assert (D_3K > D_EPOCH) is True
 
 
 def test__eq__():
-    assert (SimDateTime(1, 1, 1) == SimDateTime(1, 1, 1)) is True
-    assert (SimDateTime(1, 1, 1) == SimDateTime(2000, 1, 1)) is False
-    assert (SimDateTime(3000, 1, 1) == SimDateTime(1, 1, 1)) is False
-    assert (SimDateTime(3000, 1, 1) == SimDateTime(3000, 1, 1)) is True
+    assert (D_EPOCH == SimDateTime(1, 1, 1)) is True
+    assert (D_EPOCH == D_2K) is False
+    assert (D_3K == D_EPOCH) is False
+    assert (D_3K == SimDateTime(3000, 1, 1)) is True
 
 
 def test_to_date_str():
@@ -133,6 +143,15 @@ def test_from_iso_str():
     assert d0.month == 7
     assert d0.year == 2021
 
+    # Dates that are not zero-padded fall back to splitting on separators
+    d0 = SimDateTime.from_iso_str("2-3-4T00:00")
+    assert d0.day == 4
+    assert d0.month == 3
+    assert d0.year == 2
+
+    date = SimDateTime(2022, 6, 27)
+    assert SimDateTime.from_iso_str(date.to_iso_str()) == date
+
 
 def test_from_str():
     date = SimDateTime.from_str("03/10/0002")
@@ -211,6 +230,17 @@ def test_increment():
     assert d3.month == 6
     assert d3.year == 8
 
+    # Large increments roll over in one step, the same as the ordinal math
+    d4 = SimDateTime(1, 1, 1)
+    d4.increment(days=10_000)
+    assert d4 == SimDateTime.from_ordinal(10_001)
+    assert d4.day == 5
+    assert d4.month == 10
+    assert d4.year == 30
+
+    with pytest.raises(ValueError):
+        d4.increment(days=-1)
+
 
 def test_constructor():
     t0 = SimDateTime(1, 1, 1)
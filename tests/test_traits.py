@@ -61,3 +61,21 @@ def test_get_trait() -> None:
     assert t.__class__ == Kind
     with pytest.raises(ComponentNotFoundError):
         get_trait(character, Drunkard)
+
+
+def test_trait_manager_order() -> None:
+    trait_manager = TraitManager()
+    trait_manager.add(Drunkard)
+    trait_manager.add(Kind)
+
+    assert trait_manager.has_all((Kind, Drunkard)) is True
+    assert trait_manager.has_all((Kind, Mean)) is False
+    assert list(trait_manager) == [Drunkard, Kind]
+    assert trait_manager.to_dict() == {"traits": ["Drunkard", "Kind"]}
+    assert Orrery not in trait_manager
+
+    trait_manager.remove(Kind)
+
+    assert trait_manager.get_all() == [Drunkard]
+    with pytest.raises(KeyError):
+        trait_manager.remove(Kind)
@@ -1,5 +1,6 @@
 import random
 
+import numpy as np
 import pytest
 
 from orrery.components.virtues import Virtues, VirtueType
@@ -31,6 +32,16 @@ def test_virtue_vect_compatibility() -> None:
     assert vect_0.compatibility(vect_3) == pytest.approx(0.91, 0.1)  # type: ignore
 
 
+def test_virtue_vect_compatibility_at_extremes() -> None:
+    # The dot product of two maxed-out vectors exceeds the int16 range
+    vect_0 = Virtues({virtue.name: 50 for virtue in VirtueType})
+    vect_1 = Virtues({virtue.name: -50 for virtue in VirtueType})
+
+    assert vect_0.to_array().dtype == np.int16
+    assert vect_0.compatibility(vect_0) == 1.0
+    assert vect_0.compatibility(vect_1) == -1.0
+
+
 def test_virtue_vect_get_low_values() -> None:
     vect_0 = Virtues({"HEALTH": 10, "POWER": 20, "TRADITION": -10, "LUST": -35})
 
@@ -74,3 +85,19 @@ def test_virtue_vect_factory() -> None:
     vector: Virtues = factory.create(world, overrides={"ADVENTURE": 10, "POWER": 20})
     assert vector[VirtueType.ADVENTURE] == 10
     assert vector[VirtueType.POWER] == 20
+
+
+def test_virtue_vect_factory_random() -> None:
+    world_0 = World()
+    world_0.add_resource(random.Random(1234))
+    world_1 = World()
+    world_1.add_resource(random.Random(1234))
+    factory = VirtuesFactory()
+
+    vector_0 = factory.create(world_0, initialization="random")
+    vector_1 = factory.create(world_1, initialization="random")
+
+    # The same seed produces the same values
+    assert vector_0.to_dict() == vector_1.to_dict()
+    assert len([v for _, v in vector_0 if 30 <= v <= 50]) == 3
+    assert len([v for _, v in vector_0 if -50 <= v <= -30]) == 3